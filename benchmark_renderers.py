@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from src.components.generate_pdf import RecipePDFGenerator
+from src.components.generate_html import RecipeHTMLGenerator
+from src.components.generate_markdown import RecipeMarkdownGenerator
+
+# A typical recipe, used when no section file is provided
+SAMPLE_SECTIONS = {
+    "title": "Benchmark Recipe",
+    "author": "Benchmark Channel",
+    "ingredients": [
+        {"ingredient": f"Ingredient {i}", "quantity": f"{i * 25}g"}
+        for i in range(1, 16)
+    ]
+    + [{"ingredient": "Salt", "quantity": "N/A"}],
+    "preparation": [
+        f"Preparation step {i}: finely chop the vegetables and set them aside."
+        for i in range(1, 6)
+    ],
+    "steps": [
+        f"Step {i}: heat the pan over a medium heat, add the ingredients and stir "
+        "occasionally until cooked through."
+        for i in range(1, 13)
+    ],
+    "notes": [
+        f"Note {i}: can be stored in the fridge for up to 3 days." for i in range(1, 4)
+    ],
+}
+
+
+def benchmark(sections: dict, iterations: int) -> None:
+    """Times rendering the recipe sections with each renderer and prints the results.
+
+    Args:
+        sections (dict): The recipe sections to render.
+        iterations (int): Number of times to render the recipe with each renderer.
+    """
+    renderers = [RecipePDFGenerator(), RecipeHTMLGenerator(), RecipeMarkdownGenerator()]
+    results = {}
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        for renderer in renderers:
+            output_filename = os.path.join(output_dir, f"recipe.{renderer.extension}")
+            # Warm up, so one-off costs such as font loading are not timed
+            renderer.generate(sections, output_filename=output_filename)
+
+            timings = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                renderer.generate(sections, output_filename=output_filename)
+                timings.append(time.perf_counter() - start)
+            results[renderer.extension] = timings
+
+    pdf_mean = statistics.mean(results["pdf"])
+    print(f"{'format':<8}{'mean (ms)':>12}{'min (ms)':>12}{'vs pdf':>10}")
+    for extension, timings in results.items():
+        mean = statistics.mean(timings)
+        print(
+            f"{extension:<8}{mean * 1000:>12.3f}{min(timings) * 1000:>12.3f}"
+            f"{pdf_mean / mean:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--section_file",
+        required=False,
+        type=str,
+        help="Path to a sections json to benchmark with, instead of the sample recipe",
+    )
+    parser.add_argument(
+        "--iterations",
+        required=False,
+        type=int,
+        default=50,
+        help="Number of times to render the recipe with each renderer",
+    )
+    args = parser.parse_args()
+    if args.iterations < 1:
+        parser.error("--iterations must be a positive integer.")
+
+    sections = SAMPLE_SECTIONS
+    if args.section_file:
+        with open(args.section_file, "r") as f:
+            sections = json.load(f)
+
+    benchmark(sections, iterations=args.iterations)
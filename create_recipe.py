@@ -3,6 +3,7 @@ import logging
 
 from src.processor import process_url, generate_from_txt
 from src.logger import logger
+from src.profiler import profiler
 
 
 def main() -> None:
@@ -21,18 +22,28 @@ def main() -> None:
     logger.info("Starting recipe creation process...")
     logger.info(f"Video URL: {args.url}")
     logger.info(f"Saving to: {args.output_dir}")
+    logger.info(f"Output formats: {', '.join(args.formats)}")
 
-    if args.url:
-        process_url(
-            url=args.url,
-            recipe_output_dir=args.output_dir,
-            save_sections_json=args.save_sections_file,
-        )
-    elif args.section_file:
-        generate_from_txt(
-            recipe_output_dir=args.output_dir,
-            response_path=args.section_file,
-        )
+    if args.profile:
+        profiler.enable(top_n=args.profile_top_n, sample_rate=args.profile_sample_rate)
+
+    # Write the profiling report even if a stage fails, as that's when it's needed
+    try:
+        if args.url:
+            process_url(
+                url=args.url,
+                recipe_output_dir=args.output_dir,
+                save_sections_json=args.save_sections_file,
+                formats=args.formats,
+            )
+        elif args.section_file:
+            generate_from_txt(
+                recipe_output_dir=args.output_dir,
+                response_path=args.section_file,
+                formats=args.formats,
+            )
+    finally:
+        profiler.write_report(args.output_dir, source=args.url or args.section_file)
 
 
 if __name__ == "__main__":
@@ -62,12 +73,41 @@ if __name__ == "__main__":
         action="store_true",
         help="Path to the file containing the previously generated parsed sections",
     )
+    parser.add_argument(
+        "--format",
+        dest="formats",
+        required=False,
+        nargs="+",
+        choices=["pdf", "html", "md"],
+        default=["pdf"],
+        help="Output formats to render the recipe to, e.g. --format pdf html md",
+    )
     parser.add_argument(
         "--verbose",
         required=False,
         action="store_true",
         help="Whether to display logs",
     )
+    parser.add_argument(
+        "--profile",
+        required=False,
+        action="store_true",
+        help="Whether to profile each stage and save a report to the output directory",
+    )
+    parser.add_argument(
+        "--profile_top_n",
+        required=False,
+        type=int,
+        default=15,
+        help="Number of CPU and memory hotspots to report per stage",
+    )
+    parser.add_argument(
+        "--profile_sample_rate",
+        required=False,
+        type=float,
+        default=1.0,
+        help="Fraction of runs to profile when --profile is set",
+    )
 
     # verfy inputs
     args = parser.parse_args()
@@ -80,5 +120,9 @@ if __name__ == "__main__":
             "Please provide either a URL or a section file, not both. "
             "The URL will be used to generate the recipe PDF."
         )
+    if args.profile_top_n < 1:
+        parser.error("--profile_top_n must be a positive integer.")
+    if not 0.0 <= args.profile_sample_rate <= 1.0:
+        parser.error("--profile_sample_rate must be between 0 and 1.")
     logger.info("Arguments parsed successfully.")
     main()
@@ -0,0 +1,53 @@
+from html import escape
+
+from src.components.renderer import TemplateRecipeRenderer
+
+
+class RecipeHTMLGenerator(TemplateRecipeRenderer):
+    """A class for generating recipe HTML pages from recipe data."""
+
+    extension = "html"
+    template_filename = "recipe.html"
+
+    def _escape(self, text: str) -> str:
+        """Escape HTML special characters.
+
+        Args:
+            text (str): The text to escape
+
+        Returns:
+            str: The escaped text
+        """
+        return escape(text)
+
+    def _format_ingredients(self, ingredients: list) -> str:
+        """Format the ingredients as a 3 column list, as in the PDF.
+
+        Args:
+            ingredients (list): List of {'ingredient': str, 'quantity': str}
+
+        Returns:
+            str: The ingredients HTML list
+        """
+        items = []
+        for item in ingredients:
+            txt = f"<b>{self._escape(item['ingredient'])}</b>"
+            quantity = self._quantity(item)
+            if quantity:
+                txt += f": {self._escape(quantity)}"
+            items.append(f"<li>{txt}</li>")
+        return '<ul class="ingredients">\n' + "\n".join(items) + "\n</ul>"
+
+    def _format_list(self, items: list, ordered: bool) -> str:
+        """Format a list of strings as an HTML list.
+
+        Args:
+            items (list): The list of strings
+            ordered (bool): Whether to number the list
+
+        Returns:
+            str: The HTML list
+        """
+        tag = "ol" if ordered else "ul"
+        lines = "\n".join(f"<li>{self._escape(item)}</li>" for item in items)
+        return f"<{tag}>\n{lines}\n</{tag}>"
@@ -0,0 +1,76 @@
+import re
+
+from src.components.renderer import TemplateRecipeRenderer
+
+# Characters which would otherwise be read as markdown formatting
+MARKDOWN_ESCAPES = str.maketrans({c: "\\" + c for c in "\\`*_[]<>"})
+
+# Markers at the start of a line which would otherwise start a heading or list
+BLOCK_MARKER = re.compile(r"^([#+\-])|^(\d+)([.)])", re.MULTILINE)
+
+
+class RecipeMarkdownGenerator(TemplateRecipeRenderer):
+    """A class for generating recipe markdown documents from recipe data."""
+
+    extension = "md"
+    template_filename = "recipe.md"
+
+    def _escape(self, text: str) -> str:
+        """Escape markdown formatting characters.
+
+        Args:
+            text (str): The text to escape
+
+        Returns:
+            str: The escaped text
+        """
+        text = text.translate(MARKDOWN_ESCAPES)
+        return BLOCK_MARKER.sub(self._escape_block_marker, text)
+
+    @staticmethod
+    def _escape_block_marker(match: re.Match) -> str:
+        """Escape a heading or list marker, e.g. "# heat" → "\\# heat", "1)" → "1\\)".
+
+        Args:
+            match (re.Match): The matched block marker
+
+        Returns:
+            str: The escaped block marker
+        """
+        if match.group(1):
+            return "\\" + match.group(1)
+        return match.group(2) + "\\" + match.group(3)
+
+    def _format_ingredients(self, ingredients: list) -> str:
+        """Format the ingredients as a bulleted list.
+
+        Args:
+            ingredients (list): List of {'ingredient': str, 'quantity': str}
+
+        Returns:
+            str: The ingredients markdown list
+        """
+        lines = []
+        for item in ingredients:
+            txt = f"- **{self._escape(item['ingredient'])}**"
+            quantity = self._quantity(item)
+            if quantity:
+                txt += f": {self._escape(quantity)}"
+            lines.append(txt)
+        return "\n".join(lines)
+
+    def _format_list(self, items: list, ordered: bool) -> str:
+        """Format a list of strings as a markdown list.
+
+        Args:
+            items (list): The list of strings
+            ordered (bool): Whether to number the list
+
+        Returns:
+            str: The markdown list
+        """
+        if ordered:
+            return "\n".join(
+                f"{i}. {self._escape(item)}" for i, item in enumerate(items, start=1)
+            )
+        return "\n".join(f"- {self._escape(item)}" for item in items)
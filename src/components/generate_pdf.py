@@ -13,12 +13,15 @@ from reportlab.platypus import (
 )
 from reportlab.lib import colors
 
+from src.components.renderer import RecipeRenderer
 from src.logger import logger
 
 
-class RecipePDFGenerator:
+class RecipePDFGenerator(RecipeRenderer):
     """A class for generating recipe PDF reports from recipe data."""
 
+    extension = "pdf"
+
     def __init__(self):
         """Initialize the PDF generator with default styles."""
         self.styles = getSampleStyleSheet()
@@ -0,0 +1,94 @@
+import os
+from abc import ABC, abstractmethod
+from string import Template
+from typing import Optional
+
+from src.logger import logger
+
+templates_dir = os.path.join(os.path.dirname(__file__), "templates")
+
+
+class RecipeRenderer(ABC):
+    """Base class for rendering the recipe sections to an output file."""
+
+    # File extension of the rendered output, without the leading dot
+    extension: str
+
+    @abstractmethod
+    def generate(self, recipe_data: dict, output_filename: str) -> None:
+        """Renders the recipe data and saves it to the output file.
+
+        Args:
+            recipe_data (dict): Dictionary of recipe entries
+            output_filename (str): Where to save the rendered recipe
+        """
+
+
+class TemplateRecipeRenderer(RecipeRenderer):
+    """Base class for renderers which fill a text template from the templates directory.
+
+    Subclasses set the template filename and define how each section is formatted.
+    """
+
+    template_filename: str
+
+    def __init__(self):
+        """Read the template once so that rendering is only string formatting."""
+        with open(os.path.join(templates_dir, self.template_filename), "r") as f:
+            self.template = Template(f.read())
+
+    def render(self, recipe_data: dict) -> str:
+        """Renders the recipe data to a string.
+
+        Args:
+            recipe_data (dict): Dictionary of recipe entries
+
+        Returns:
+            str: The rendered recipe
+        """
+        return self.template.substitute(
+            title=self._escape(recipe_data["title"]),
+            author=self._escape(recipe_data["author"]),
+            ingredients=self._format_ingredients(recipe_data["ingredients"]),
+            preparation=self._format_list(recipe_data["preparation"], ordered=False),
+            steps=self._format_list(recipe_data["steps"], ordered=True),
+            notes=self._format_list(recipe_data["notes"], ordered=False),
+        )
+
+    def generate(self, recipe_data: dict, output_filename: str) -> None:
+        """Renders the recipe data and saves it to the output file.
+
+        Args:
+            recipe_data (dict): Dictionary of recipe entries
+            output_filename (str): Where to save the rendered recipe
+        """
+        logger.info(f"Generating Recipe {self.extension.upper()}")
+        with open(output_filename, "w", encoding="utf-8") as f:
+            f.write(self.render(recipe_data))
+        logger.info(f"Generated {self.extension.upper()}, saved to '{output_filename}'")
+
+    @staticmethod
+    def _quantity(item: dict) -> Optional[str]:
+        """Get the quantity of an ingredient, skipping unknown quantities as in the PDF.
+
+        Args:
+            item (dict): Dictionary with keys "ingredient" and "quantity"
+
+        Returns:
+            str | None: The quantity, or None if it is missing or "N/A"
+        """
+        if item.get("quantity") and item["quantity"] != "N/A":
+            return item["quantity"]
+        return None
+
+    @abstractmethod
+    def _escape(self, text: str) -> str:
+        """Escape text for the output format."""
+
+    @abstractmethod
+    def _format_ingredients(self, ingredients: list) -> str:
+        """Format the list of ingredient dictionaries."""
+
+    @abstractmethod
+    def _format_list(self, items: list, ordered: bool) -> str:
+        """Format a list of strings as a bulleted or numbered list."""
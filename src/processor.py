@@ -1,5 +1,6 @@
 import os
 import json
+from typing import Sequence
 
 from src.components.get_youtube_response import (
     get_transcript_from_url,
@@ -7,33 +8,77 @@ from src.components.get_youtube_response import (
 )
 from src.components.parse_transcript import get_gemini_response, parse_sections
 from src.components.generate_pdf import RecipePDFGenerator
+from src.components.generate_html import RecipeHTMLGenerator
+from src.components.generate_markdown import RecipeMarkdownGenerator
 from src.logger import logger
+from src.profiler import profiler
 
-pdf_generator = RecipePDFGenerator()
+# Renderers for each output format, keyed by file extension
+renderers = {
+    renderer.extension: renderer
+    for renderer in (
+        RecipePDFGenerator(),
+        RecipeHTMLGenerator(),
+        RecipeMarkdownGenerator(),
+    )
+}
 
 
-def process_url(url: str, recipe_output_dir: str, save_sections_json: bool) -> None:
+def render_sections(
+    sections: dict, recipe_output_dir: str, formats: Sequence[str]
+) -> None:
+    """Renders the recipe sections to each of the output formats.
+
+    Args:
+        sections (dict): The parsed recipe sections and metadata.
+        recipe_output_dir (str): A specified dir to save the outputs in.
+        formats (Sequence[str]): The output formats to render, keys of `renderers`.
+    """
+    if not os.path.exists(recipe_output_dir):
+        os.makedirs(recipe_output_dir, exist_ok=True)
+
+    # Deduplicate while keeping order, so each format is only rendered once
+    for output_format in dict.fromkeys(formats):
+        renderer = renderers[output_format]
+        output_filename = os.path.join(
+            recipe_output_dir, sections["title"] + "." + renderer.extension
+        )
+        with profiler.stage(f"generate_{output_format}"):
+            renderer.generate(sections, output_filename=output_filename)
+
+
+def process_url(
+    url: str,
+    recipe_output_dir: str,
+    save_sections_json: bool,
+    formats: Sequence[str] = ("pdf",),
+) -> None:
     """Generates the report output from the youtube video URL.
     1. Gets the youtube transcript and metadata
     2. Pass the transcript to gemini and get the parsed information
-    3. Generate the output PDF.
+    3. Generate the outputs (PDF by default).
 
     Args:
         url (str): Youtube video URL.
         recipe_output_dir (str, optional): A specified dir to save the pdf in. Defaults to None.
         save_output (bool, optional): Whether to save the gemini response and metadata.
           Defaults to False.
+        formats (Sequence[str], optional): Output formats to render. Defaults to ("pdf",).
     """
     # 1. Download the transcript and metadata
-    transcript = get_transcript_from_url(url)
-    metadata = get_video_metadata(url)
+    with profiler.stage("fetch_transcript"):
+        transcript = get_transcript_from_url(url)
+    with profiler.stage("fetch_metadata"):
+        metadata = get_video_metadata(url)
 
     # 2. Read the transcript and get the parsed sections:
     # (ingredients, preparatation, steps, notes)
-    response = get_gemini_response(transcript)
+    with profiler.stage("gemini_response"):
+        response = get_gemini_response(transcript)
 
     logger.info("Parsing Gemini output to sections")
-    sections = parse_sections(response.text)
+    with profiler.stage("parse_sections"):
+        sections = parse_sections(response.text)
 
     sections.update(metadata)
 
@@ -52,29 +97,28 @@ def process_url(url: str, recipe_output_dir: str, save_sections_json: bool) -> N
             json.dump(sections, f, indent=4)
         logger.info(f"Saved sections to '{section_output_filename}'")
 
-    # 3. Generate the output pdf
-    if not os.path.exists(recipe_output_dir):
-        os.makedirs(recipe_output_dir, exist_ok=True)
-    output_filename = os.path.join(recipe_output_dir, sections["title"] + ".pdf")
-
-    pdf_generator.generate(sections, output_filename=output_filename)
+    # 3. Generate the outputs
+    render_sections(sections, recipe_output_dir, formats)
 
 
-def generate_from_txt(recipe_output_dir: str, response_path: str) -> None:
+def generate_from_txt(
+    recipe_output_dir: str, response_path: str, formats: Sequence[str] = ("pdf",)
+) -> None:
     """Generate the recipe PDF from the gemini parsed section file.
 
     1. Read the gemini section file
-    2. Generate the output PDF.
+    2. Generate the outputs (PDF by default).
 
 
     Args:
         recipe_output_dir (str): A specified dir to save the pdf in.
         response_path (str, optional): Path to the parsed gemini section json.
+        formats (Sequence[str], optional): Output formats to render. Defaults to ("pdf",).
     """
 
     # 1. Read the section json
     try:
-        with open(response_path, "r") as f:
+        with open(response_path, "r") as f, profiler.stage("load_sections"):
             sections = json.load(f)
     except FileNotFoundError:
         logger.error(f"File not found: {response_path}")
@@ -88,9 +132,5 @@ def generate_from_txt(recipe_output_dir: str, response_path: str) -> None:
 
     logger.info("Parsed sections from json file")
 
-    # 2. Generate the output pdf
-    if not os.path.exists(recipe_output_dir):
-        os.makedirs(recipe_output_dir, exist_ok=True)
-    output_filename = os.path.join(recipe_output_dir, sections["title"] + ".pdf")
-
-    pdf_generator.generate(sections, output_filename=output_filename)
+    # 2. Generate the outputs
+    render_sections(sections, recipe_output_dir, formats)
@@ -0,0 +1,197 @@
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import random
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from src.logger import logger
+
+
+class StageProfiler:
+    """A class for profiling the CPU time and memory usage of each pipeline stage.
+
+    Disabled by default, in which case `stage` is a no-op. Once enabled, each stage is
+    wrapped with cProfile and tracemalloc, and a per-stage report is written with
+    `write_report`.
+    """
+
+    def __init__(self):
+        """Initialize the profiler in the disabled state."""
+        self.enabled = False
+        self.top_n = 15
+        self.stages: List[Dict] = []
+        self.started_at: Optional[datetime] = None
+
+    def enable(self, top_n: int = 15, sample_rate: float = 1.0) -> bool:
+        """Enable profiling for this run.
+
+        Args:
+            top_n (int, optional): Number of hotspots to report per stage. Defaults to 15.
+            sample_rate (float, optional): Probability of profiling this run, so it can be
+              left switched on for a fraction of production runs. Defaults to 1.0.
+
+        Returns:
+            bool: Whether profiling was enabled for this run.
+        """
+        if random.random() >= sample_rate:
+            logger.info("Run not sampled for profiling")
+            return False
+
+        self.enabled = True
+        self.top_n = top_n
+        self.started_at = datetime.now()
+        # A single frame per allocation keeps the tracemalloc overhead low
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+        # Warm up the snapshot filters, so their pattern caches are not counted in a
+        # stage. The first snapshot has no traces to filter, so two are needed.
+        for _ in range(2):
+            self._take_snapshot()
+        logger.info("Profiling enabled")
+        return True
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Profile the wrapped block as a named pipeline stage.
+
+        Args:
+            name (str): The name of the stage, used in the report.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        # Take the snapshot before the baseline, so its own memory is not counted
+        start_snapshot = self._take_snapshot()
+        tracemalloc.reset_peak()
+        start_memory, _ = tracemalloc.get_traced_memory()
+        cpu_profile = cProfile.Profile()
+
+        error = None
+        start_time = time.perf_counter()
+        cpu_profile.enable()
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            cpu_profile.disable()
+            elapsed = time.perf_counter() - start_time
+
+            _, peak_memory = tracemalloc.get_traced_memory()
+            end_snapshot = self._take_snapshot()
+            memory_diff = [
+                diff
+                for diff in end_snapshot.compare_to(start_snapshot, "lineno")
+                if diff.size_diff or diff.count_diff
+            ]
+
+            self.stages.append(
+                {
+                    "name": name,
+                    "error": error,
+                    "elapsed": elapsed,
+                    "peak_memory": peak_memory - start_memory,
+                    "net_blocks": sum(d.count_diff for d in memory_diff),
+                    "allocated": sum(d.size_diff for d in memory_diff),
+                    "cpu_hotspots": self._format_cpu_hotspots(cpu_profile),
+                    "memory_hotspots": memory_diff[: self.top_n],
+                }
+            )
+            logger.info(f"Profiled stage '{name}' in {elapsed:.3f}s")
+
+    @staticmethod
+    def _take_snapshot() -> tracemalloc.Snapshot:
+        """Take a tracemalloc snapshot, ignoring the profiler's own allocations.
+
+        Returns:
+            tracemalloc.Snapshot: The filtered snapshot.
+        """
+        return tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, contextlib.__file__),
+                tracemalloc.Filter(False, cProfile.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+
+    def _format_cpu_hotspots(self, cpu_profile: cProfile.Profile) -> str:
+        """Format the top CPU hotspots of a stage profile.
+
+        Args:
+            cpu_profile (cProfile.Profile): The profile collected for the stage.
+
+        Returns:
+            str: The top functions sorted by cumulative time.
+        """
+        stream = io.StringIO()
+        stats = pstats.Stats(cpu_profile, stream=stream)
+        stats.strip_dirs().sort_stats("cumulative").print_stats(self.top_n)
+        return stream.getvalue()
+
+    def write_report(self, output_dir: str, source: str) -> Optional[str]:
+        """Write the per-stage profiling report to a text file in the output directory.
+
+        The file name contains the time profiling was enabled, so reports from runs
+        sharing an output directory don't overwrite each other.
+
+        Args:
+            output_dir (str): The directory to save the report in.
+            source (str): The URL or section file the run was generated from.
+
+        Returns:
+            str | None: The report path, or None if profiling was not enabled.
+        """
+        if not self.enabled:
+            return None
+
+        lines = [
+            "Profiling report",
+            f"Source: {source}",
+            f"Started: {self.started_at.isoformat(sep=' ', timespec='seconds')}",
+            "",
+            "Stage summary",
+            "-" * 84,
+        ]
+        lines.append(
+            f"{'stage':<24}{'time (s)':>12}{'peak (KiB)':>14}"
+            f"{'net blocks':>12}{'net (KiB)':>12}  status"
+        )
+        for stage in self.stages:
+            status = f"failed: {stage['error']}" if stage["error"] else "ok"
+            lines.append(
+                f"{stage['name']:<24}{stage['elapsed']:>12.3f}"
+                f"{stage['peak_memory'] / 1024:>14.1f}{stage['net_blocks']:>12}"
+                f"{stage['allocated'] / 1024:>12.1f}  {status}"
+            )
+
+        for stage in self.stages:
+            header = f"Stage: {stage['name']}"
+            if stage["error"]:
+                header += f" (failed: {stage['error']})"
+            lines.extend(["", "=" * 84, header, "=" * 84])
+            lines.append(f"Top {self.top_n} CPU hotspots:")
+            lines.append(stage["cpu_hotspots"])
+            lines.append(f"Top {self.top_n} memory allocation sites:")
+            lines.extend(f"  {diff}" for diff in stage["memory_hotspots"])
+
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+        output_filename = os.path.join(
+            output_dir, f"profile_report_{self.started_at:%Y%m%d_%H%M%S_%f}.txt"
+        )
+        with open(output_filename, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        logger.info(f"Saved profiling report to '{output_filename}'")
+        return output_filename
+
+
+profiler = StageProfiler()